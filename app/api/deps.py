@@ -4,18 +4,43 @@ Common dependencies for API endpoints
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import ColumnElement, true
 from sqlalchemy.orm import Session
 from typing import Annotated
+from cachetools import TTLCache
 
 from app.database import get_db
-from app.models.user import User
-from app.core.security import verify_token
+from app.models.user import User, UserRole
+from app.core.security import verify_token_cached
 
 # Security
 security = HTTPBearer()
 
+# Roles allowed through admin-only endpoints (compared lowercased)
+_ADMIN_ROLES = frozenset({UserRole.ADMIN.value, UserRole.STAFF.value})
 
-async def get_current_user(
+# Recently loaded users, keyed by email (per-process only). Only the fields
+# authorization needs are kept; never the password hash or profile data
+user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+_CACHED_USER_FIELDS = ("id", "email", "role", "is_active")
+
+
+def is_admin(user: User) -> bool:
+    """Check whether a user has an admin or staff role"""
+    return user.role.lower() in _ADMIN_ROLES
+
+
+def owned_by(model, user: User) -> ColumnElement[bool]:
+    """WHERE clause limiting a write to rows the user owns (admins: any row)"""
+    return true() if is_admin(user) else model.user_id == user.id
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop a user from the lookup cache after their row changes"""
+    user_cache.pop(email, None)
+
+
+def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Session = Depends(get_db)
 ) -> User:
@@ -27,7 +52,7 @@ async def get_current_user(
     )
 
     # Verify token
-    payload = verify_token(credentials.credentials)
+    payload = verify_token_cached(credentials.credentials)
     if payload is None:
         raise credentials_exception
 
@@ -35,11 +60,19 @@ async def get_current_user(
     if email is None:
         raise credentials_exception
 
+    # Hot users are served from the cache as detached copies holding only
+    # id/email/role/is_active; handlers that need anything else, or want to
+    # write, load the row with db.get(User, current_user.id)
+    cached = user_cache.get(email)
+    if cached is not None:
+        return User(**cached)
+
     # Get user from database
     user = db.query(User).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
 
+    user_cache[email] = {field: getattr(user, field) for field in _CACHED_USER_FIELDS}
     return user
 
 
@@ -55,15 +88,21 @@ async def get_current_active_user(
     return current_user
 
 
-async def get_admin_user(
-    current_user: User = Depends(get_current_active_user)
+def get_admin_user(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
 ) -> User:
     """Get current user if they are admin"""
-    if current_user.role not in ["ADMIN", "staff"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
+    if not is_admin(current_user):
+        # A cached role can predate a promotion, so check the row before refusing
+        invalidate_cached_user(current_user.email)
+        user = db.get(User, current_user.id)
+        if user is None or not user.is_active or not is_admin(user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions"
+            )
+        current_user = user
     return current_user
 
 
@@ -0,0 +1,36 @@
+"""
+Conditional GET (ETag / If-None-Match) helpers for detail endpoints
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+def row_etag(row_id: int, updated_at: datetime) -> str:
+    """Weak ETag for a row, built from its id and updated_at.
+
+    updated_at is re-stamped in Python to the microsecond on every write, so
+    it changes whenever the row does. Handlers read just that column to build
+    the tag, so a warm request never loads the row.
+    """
+    return f'W/"{row_id}-{updated_at.isoformat()}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if the client's If-None-Match already has etag, else None"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def etag_response(model: BaseModel, etag: str) -> Response:
+    """Serialize a response model with its ETag"""
+    return Response(
+        content=model.model_dump_json(), media_type="application/json", headers={"ETag": etag}
+    )
@@ -0,0 +1,86 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    raw = json.dumps({"ts": created_at.isoformat(), "id": row_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(data["ts"]), int(data["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def select_rows(model: Any, schema: type[BaseModel]) -> Select:
+    """Select the columns a response schema reads from a model, as plain rows.
+
+    List endpoints only serialize the rows, so skipping ORM hydration and
+    identity-map bookkeeping saves work per row, and columns the response
+    never shows (such as stored embeddings) are not fetched at all. The
+    schema must include id and created_at, which the cursor is built from.
+    """
+    columns = model.__table__.columns
+    return select(*(columns[name] for name in schema.model_fields))
+
+
+def paginate(
+    db: Session,
+    stmt: Select,
+    model: Any,
+    limit: int,
+    page: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+) -> dict:
+    """Fetch one page of a select, newest first.
+
+    Rows are ordered by (created_at, id) descending and the next page starts
+    after the cursor of the last row returned. An explicit page falls back to
+    OFFSET/LIMIT with a total count, for older clients.
+    """
+    total = None
+    if include_total or page is not None:
+        total = db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    stmt = stmt.order_by(model.created_at.desc(), model.id.desc())
+    if page is not None:
+        stmt = stmt.offset((page - 1) * limit)
+    elif cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) < (created_at, row_id))
+
+    # Fetch one extra row to know whether another page exists
+    rows = db.execute(stmt.limit(limit + 1)).all()
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "per_page": limit,
+        "pages": (total + limit - 1) // limit if total is not None else None,
+        "next_cursor": next_cursor,
+    }
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from sqlalchemy import select, exists, func, update
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
 # ✅ CORRECT imports:
@@ -17,36 +18,47 @@ from app.core.security import (
     create_access_token, create_refresh_token, verify_token
 )
 from app.core.config import settings
-from app.api.deps import get_current_active_user, get_admin_user
+from app.api.deps import get_current_active_user, get_admin_user, invalidate_cached_user
 
 router = APIRouter()
 
+# Access token lifetime is fixed for the process
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.access_token_expire_minutes)
+_ACCESS_TOKEN_TTL_SECONDS = int(_ACCESS_TOKEN_TTL.total_seconds())
+
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
+def signup(user_data: UserSignup, db: Session = Depends(get_db)):
     """Register a new user with student email verification"""
     
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+    # Check for an existing user and the registry entry in one round-trip.
+    # Input emails are lowercased by the schema; stored ones may predate that
+    existing = db.execute(
+        select(
+            exists().where(func.lower(User.email) == user_data.email).label("user_exists"),
+            exists()
+            .where(
+                func.lower(StudentRegistry.email) == user_data.email,
+                StudentRegistry.student_id == user_data.student_id
+            )
+            .label("in_registry"),
+        )
+    ).one()
+    
+    if existing.user_exists:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered"
         )
     
     # Verify student is in registry
-    student = db.query(StudentRegistry).filter(
-        StudentRegistry.email == user_data.email,
-        StudentRegistry.student_id == user_data.student_id
-    ).first()
-    
-    if not student:
+    if not existing.in_registry:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Student not found in registry. Please contact admin."
         )
     
-    # Create new user
+    # Create new user (bcrypt is slow; this handler already runs in the threadpool)
     hashed_password = get_password_hash(user_data.password)
     new_user = User(
         email=user_data.email,
@@ -57,19 +69,21 @@ async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
     return new_user
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """Authenticate user and return JWT tokens"""
     
-    # Find user
-    user = db.query(User).filter(User.email == user_credentials.email).first()
+    # Find user (stored emails may predate lowercasing, so compare lowered)
+    user = db.query(User).filter(func.lower(User.email) == user_credentials.email).first()
     
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    password_ok = user is not None and verify_password(
+        user_credentials.password, user.hashed_password
+    )
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -82,22 +96,28 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Account is deactivated"
         )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
+    # Update last login, reading the row back in the same statement
+    user = db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(last_login=datetime.now(timezone.utc))
+        .returning(User)
+    ).scalar_one()
     
     # Create tokens
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email}, expires_delta=_ACCESS_TOKEN_TTL
     )
     refresh_token = create_refresh_token(data={"sub": user.email})
     
+    db.commit()
+    invalidate_cached_user(user.email)
+    
     return TokenResponse(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=_ACCESS_TOKEN_TTL_SECONDS,
         user=user
     )
 
@@ -126,9 +146,8 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
 #         raise credentials_exception
     
 #     # Create new tokens
-#     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
 #     access_token = create_access_token(
-#         data={"sub": user.email}, expires_delta=access_token_expires
+#         data={"sub": user.email}, expires_delta=_ACCESS_TOKEN_TTL
 #     )
 #     new_refresh_token = create_refresh_token(data={"sub": user.email})
     
@@ -136,38 +155,45 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
 #         access_token=access_token,
 #         refresh_token=new_refresh_token,
 #         token_type="bearer",
-#         expires_in=settings.access_token_expire_minutes * 60,
+#         expires_in=_ACCESS_TOKEN_TTL_SECONDS,
 #         user=user
 #     )
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(current_user: User = Depends(get_current_active_user)):
+def get_current_user_profile(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
     """Get current user profile"""
-    return current_user
+    # current_user may be a cached copy with only the auth fields
+    return db.get(User, current_user.id)
 
 
 @router.put("/profile", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Update current user profile"""
     
+    # current_user may be a cached detached copy, so load the row to update
+    user = db.get(User, current_user.id)
+    
     # Update fields if provided
     if user_update.full_name is not None:
-        current_user.full_name = user_update.full_name
+        user.full_name = user_update.full_name
     if user_update.phone is not None:
-        current_user.phone = user_update.phone
+        user.phone = user_update.phone
     if user_update.bio is not None:
-        current_user.bio = user_update.bio
+        user.bio = user_update.bio
     
-    current_user.updated_at = datetime.utcnow()
+    # updated_at is stamped on flush (onupdate)
     db.commit()
-    db.refresh(current_user)
+    invalidate_cached_user(user.email)
     
-    return current_user
+    return user
 
 
 @router.post("/logout", response_model=MessageResponse)
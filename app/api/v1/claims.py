@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
+from sqlalchemy import Select, select, exists, update
 from typing import Optional
-from datetime import datetime
 
 from app.models.claim import Claim
 from app.models.found_item import FoundItem
@@ -11,34 +11,79 @@ from app.schemas.claim import (
 )
 from app.schemas.base_schema import MessageResponse
 from app.database import get_db
-from app.api.deps import get_current_active_user, get_admin_user
+from app.api.deps import get_current_active_user, get_admin_user, is_admin
+from app.api.etag import etag_response, not_modified, row_etag
+from app.api.pagination import paginate, select_rows
 
 router = APIRouter()
 
+# Claim states that block the same user from claiming an item again
+OPEN_CLAIM_STATUSES = ("pending", "approved")
+
+
+def paginate_claims(
+    db: Session,
+    stmt: Select,
+    page: Optional[int],
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+) -> PaginatedClaims:
+    """Paginate a claims select newest first"""
+    result = paginate(db, stmt, Claim, limit, page=page, cursor=cursor, include_total=include_total)
+    return PaginatedClaims(claims=result.pop("items"), **result)
+
+
+def decide_pending_claim(db: Session, claim_id: int, new_status: str, **values) -> Claim:
+    """Move a pending claim to new_status and return the updated row.
+
+    The status check and the write happen in one UPDATE ... RETURNING, so
+    two admins can't both decide the same claim and no SELECT is needed
+    first. The claim is only looked up again to tell 404 from 400.
+    """
+    claim = db.execute(
+        update(Claim)
+        .where(Claim.id == claim_id, Claim.status == "pending")
+        .values(status=new_status, **values)
+        .returning(Claim)
+    ).scalar_one_or_none()
+    if claim is None:
+        if db.get(Claim, claim_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Only pending claims can be {new_status}",
+        )
+    return claim
+
+
 @router.post("/", response_model=ClaimResponse, status_code=status.HTTP_201_CREATED)
-async def create_claim(
+def create_claim(
     claim_data: ClaimCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Create a new claim for a found item"""
 
-    found_item = db.query(FoundItem).filter(FoundItem.id == claim_data.found_item_id).first()
+    found_item = db.get(FoundItem, claim_data.found_item_id)
     if not found_item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Found item not found")
 
     if found_item.user_id == current_user.id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot claim your own item")
 
-    existing = db.query(Claim).filter(
-        Claim.found_item_id == claim_data.found_item_id,
-        Claim.user_id == current_user.id,
-        Claim.status.in_(["pending", "approved"]),
-    ).first()
-    if existing:
+    already_claimed = db.scalar(
+        select(
+            exists().where(
+                Claim.found_item_id == claim_data.found_item_id,
+                Claim.user_id == current_user.id,
+                Claim.status.in_(OPEN_CLAIM_STATUSES),
+            )
+        )
+    )
+    if already_claimed:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="You have already claimed this item")
 
-    now = datetime.utcnow()
     new_claim = Claim(
         found_item_id=claim_data.found_item_id,
         user_id=current_user.id,
@@ -46,132 +91,135 @@ async def create_claim(
         contact_info=claim_data.contact_info,
         additional_proof=claim_data.additional_proof,
         status="pending",
-        created_at=now,
-        updated_at=now,
     )
 
     db.add(new_claim)
     db.commit()
-    db.refresh(new_claim)
     return new_claim
 
 
 @router.get("/", response_model=PaginatedClaims)
-async def get_claims(
-    page: int = Query(1, ge=1),
+def get_claims(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
     status: Optional[str] = Query(None),
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """List all claims (admin only)"""
-    query = db.query(Claim)
+    stmt = select_rows(Claim, ClaimResponse)
     if status:
-        query = query.filter(Claim.status == status)
-    total = query.count()
-    items = query.offset((page - 1) * limit).limit(limit).all()
-    pages = (total + limit - 1) // limit
-    return PaginatedClaims(claims=items, total=total, page=page, per_page=limit, pages=pages)
+        stmt = stmt.where(Claim.status == status)
+    return paginate_claims(db, stmt, page, limit, cursor, include_total)
 
 
 @router.get("/{claim_id}", response_model=ClaimResponse)
-async def get_claim(
+def get_claim(
     claim_id: int,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Get specific claim details"""
-    claim = db.query(Claim).filter(Claim.id == claim_id).first()
-    if not claim:
+    # Probe owner and version first; a client with the current ETag gets a 304
+    # without the full row being loaded
+    probe = db.execute(
+        select(Claim.user_id, Claim.updated_at).where(Claim.id == claim_id)
+    ).first()
+    if not probe:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
-    if claim.user_id != current_user.id and current_user.role not in ["admin", "staff"]:
+    if probe.user_id != current_user.id and not is_admin(current_user):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
-    return claim
+
+    etag = row_etag(claim_id, probe.updated_at)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    claim = db.get(Claim, claim_id)
+    if not claim:
+        # Deleted between the probe and this load
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
+    return etag_response(ClaimResponse.model_validate(claim), row_etag(claim.id, claim.updated_at))
 
 
 @router.put("/{claim_id}/approve", response_model=ClaimResponse)
-async def approve_claim(
+def approve_claim(
     claim_id: int,
     approval_data: ClaimApproval,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """Approve a pending claim (admin only)"""
-    claim = db.query(Claim).filter(Claim.id == claim_id).first()
-    if not claim:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
-    if claim.status != "pending":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only pending claims can be approved")
-
-    now = datetime.utcnow()
-    claim.status = "approved"
-    claim.verified_by = current_user.id
-    claim.verification_notes = approval_data.approval_notes
-    claim.updated_at = now
+    claim = decide_pending_claim(
+        db,
+        claim_id,
+        "approved",
+        verified_by=current_user.id,
+        verification_notes=approval_data.approval_notes,
+    )
 
-    item = db.query(FoundItem).filter(FoundItem.id == claim.found_item_id).first()
-    if item:
-        item.status = "claimed"
-        item.updated_at = now
+    # Same transaction, and found_item_id came back with the claim row
+    db.execute(
+        update(FoundItem)
+        .where(FoundItem.id == claim.found_item_id)
+        .values(status="claimed")
+    )
 
     db.commit()
-    db.refresh(claim)
     return claim
 
 
 @router.put("/{claim_id}/reject", response_model=ClaimResponse)
-async def reject_claim(
+def reject_claim(
     claim_id: int,
     rejection_data: ClaimRejection,
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """Reject a pending claim (admin only)"""
-    claim = db.query(Claim).filter(Claim.id == claim_id).first()
-    if not claim:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
-    if claim.status != "pending":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only pending claims can be rejected")
-
-    claim.status = "rejected"
-    claim.verified_by = current_user.id
-    claim.rejection_reason = rejection_data.rejection_reason
-    claim.updated_at = datetime.utcnow()
+    claim = decide_pending_claim(
+        db,
+        claim_id,
+        "rejected",
+        verified_by=current_user.id,
+        rejection_reason=rejection_data.rejection_reason,
+    )
 
     db.commit()
-    db.refresh(claim)
     return claim
 
 
 @router.get("/my-claims/", response_model=PaginatedClaims)
-async def get_my_claims(
-    page: int = Query(1, ge=1),
+def get_my_claims(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
     status: Optional[str] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Get current user’s claims"""
-    query = db.query(Claim).filter(Claim.user_id == current_user.id)
+    stmt = select_rows(Claim, ClaimResponse).where(Claim.user_id == current_user.id)
     if status:
-        query = query.filter(Claim.status == status)
-    total = query.count()
-    items = query.offset((page - 1) * limit).limit(limit).all()
-    pages = (total + limit - 1) // limit
-    return PaginatedClaims(claims=items, total=total, page=page, per_page=limit, pages=pages)
+        stmt = stmt.where(Claim.status == status)
+    return paginate_claims(db, stmt, page, limit, cursor, include_total)
 
 
 @router.delete("/{claim_id}", response_model=MessageResponse)
-async def cancel_claim(
+def cancel_claim(
     claim_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Cancel a pending claim (owner or admin)"""
-    claim = db.query(Claim).filter(Claim.id == claim_id).first()
+    claim = db.get(Claim, claim_id)
     if not claim:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
-    if claim.user_id != current_user.id and current_user.role not in ["admin", "staff"]:
+    if claim.user_id != current_user.id and not is_admin(current_user):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
     if claim.status != "pending":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only pending claims can be cancelled")
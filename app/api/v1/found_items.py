@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import Column, Enum as SQLEnum, or_
+from sqlalchemy import Column, Enum as SQLEnum, or_, select, update, delete
 from typing import Optional, List
 from datetime import datetime
 
@@ -14,7 +14,9 @@ from app.schemas.found_item import (
 )
 from app.schemas.base_schema import MessageResponse
 from app.database import get_db
-from app.api.deps import get_current_active_user, get_admin_user
+from app.api.deps import get_current_active_user, get_admin_user, is_admin, owned_by
+from app.api.etag import etag_response, not_modified, row_etag
+from app.api.pagination import paginate, select_rows
 
 router = APIRouter()
 
@@ -27,9 +29,28 @@ FoundItem.__table__.columns["status"].type = SQLEnum(
     values_callable=lambda enum: [e.value for e in enum]
 )
 
+VALID_ITEM_STATUSES: frozenset[str] = frozenset(e.value for e in ItemStatus)
+ACTIVE_VALUE = ItemStatus.ACTIVE.value
+# Legacy status names still accepted from older clients
+STATUS_ALIASES = {"available": ACTIVE_VALUE}
+
+
+def check_owned_item(db: Session, item_id: int, user: User) -> FoundItem:
+    """Load an item the user may modify, raising 404 or 403 otherwise.
+
+    Writes put the ownership check in their WHERE clause; this is the
+    fallback that explains why no row matched.
+    """
+    item = db.get(FoundItem, item_id)
+    if not item:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if item.user_id != user.id and not is_admin(user):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return item
+
 
 @router.post("/", response_model=FoundItemResponse, status_code=status.HTTP_201_CREATED)
-async def create_found_item(
+def create_found_item(
     item_data: FoundItemCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -48,216 +69,200 @@ async def create_found_item(
     )
     db.add(new_item)
     db.commit()
-    db.refresh(new_item)
     return new_item
 
 
 @router.get("/", response_model=PaginatedFoundItems)
-async def get_found_items(
-    page: int = Query(1, ge=1),
+def get_found_items(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+    search: Optional[str] = Query(None, max_length=100),
     category: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
-    location: Optional[str] = Query(None),
-    date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    location: Optional[str] = Query(None, max_length=200),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """List all found items with filtering"""
-    query = db.query(FoundItem)
+    stmt = select_rows(FoundItem, FoundItemResponse)
 
     if search:
-        query = query.filter(
+        pattern = f"%{search}%"
+        stmt = stmt.where(
             or_(
-                FoundItem.title.ilike(f"%{search}%"),
-                FoundItem.description.ilike(f"%{search}%"),
+                FoundItem.title.ilike(pattern),
+                FoundItem.description.ilike(pattern),
             )
         )
     if category:
-        query = query.filter(FoundItem.category == category)
-    if status:
+        stmt = stmt.where(FoundItem.category == category)
+    if status_filter:
         # Legacy support: convert "available" to "active"
-        if status == "available":
-            status = ItemStatus.ACTIVE.value
-        if status not in {e.value for e in ItemStatus}:
+        status_filter = STATUS_ALIASES.get(status_filter, status_filter)
+        if status_filter not in VALID_ITEM_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status filter: {status}",
+                detail=f"Invalid status filter: {status_filter}",
             )
-        query = query.filter(FoundItem.status == status)
+        stmt = stmt.where(FoundItem.status == status_filter)
     if location:
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 FoundItem.location_found.ilike(f"%{location}%"),
                 FoundItem.current_location.ilike(f"%{location}%"),
             )
         )
+    # date_from/date_to are parsed (and rejected with 422) by FastAPI
     if date_from:
-        try:
-            d0 = datetime.fromisoformat(date_from)
-            query = query.filter(FoundItem.date_found >= d0)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid date_from format; use ISO."
-            )
+        stmt = stmt.where(FoundItem.date_found >= date_from)
     if date_to:
-        try:
-            d1 = datetime.fromisoformat(date_to)
-            query = query.filter(FoundItem.date_found <= d1)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid date_to format; use ISO."
-            )
+        stmt = stmt.where(FoundItem.date_found <= date_to)
 
-    total = query.count()
-    offset = (page - 1) * limit
-    items = query.offset(offset).limit(limit).all()
-    pages = (total + limit - 1) // limit
-
-    return PaginatedFoundItems(
-        items=items,
-        total=total,
-        page=page,
-        per_page=limit,
-        pages=pages,
-    )
+    return PaginatedFoundItems(**paginate(
+        db, stmt, FoundItem, limit, page=page, cursor=cursor, include_total=include_total
+    ))
 
 
 @router.get("/{item_id}", response_model=FoundItemResponse)
-async def get_found_item(
+def get_found_item(
     item_id: int,
+    request: Request,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Get specific found item details"""
-    item = db.query(FoundItem).get(item_id)
+    # Probe the version first; a client with the current ETag gets a 304
+    # without the full row being loaded
+    updated_at = db.scalar(select(FoundItem.updated_at).where(FoundItem.id == item_id))
+    if updated_at is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    etag = row_etag(item_id, updated_at)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    item = db.get(FoundItem, item_id)
     if not item:
+        # Deleted between the probe and this load
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    return item
+    return etag_response(FoundItemResponse.model_validate(item), row_etag(item.id, item.updated_at))
 
 
 @router.put("/{item_id}", response_model=FoundItemResponse)
-async def update_found_item(
+def update_found_item(
     item_id: int,
     item_update: FoundItemUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Update found item (owner or admin)"""
-    item = db.query(FoundItem).get(item_id)
-    if not item:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    if item.user_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    for k, v in item_update.dict(exclude_unset=True).items():
-        setattr(item, k, v)
-    item.updated_at = datetime.utcnow()
+    update_data = item_update.model_dump(exclude_unset=True)
+
+    # Ownership is checked in the WHERE clause, so the happy path is a single
+    # UPDATE ... RETURNING; the row is only looked up to tell 404 from 403
+    item = None
+    if update_data:
+        item = db.execute(
+            update(FoundItem)
+            .where(FoundItem.id == item_id, owned_by(FoundItem, current_user))
+            .values(**update_data)
+            .returning(FoundItem)
+        ).scalar_one_or_none()
+    if item is None:
+        item = check_owned_item(db, item_id, current_user)
     db.commit()
-    db.refresh(item)
     return item
 
 
 @router.delete("/{item_id}", response_model=MessageResponse)
-async def delete_found_item(
+def delete_found_item(
     item_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Delete found item (owner or admin)"""
-    item = db.query(FoundItem).get(item_id)
-    if not item:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    if item.user_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    db.delete(item)
+    deleted_id = db.execute(
+        delete(FoundItem)
+        .where(FoundItem.id == item_id, owned_by(FoundItem, current_user))
+        .returning(FoundItem.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
+        check_owned_item(db, item_id, current_user)
     db.commit()
     return MessageResponse(message="Deleted", success=True)
 
 
 @router.get("/my-items/", response_model=PaginatedFoundItems)
-async def get_my_found_items(
-    page: int = Query(1, ge=1),
+def get_my_found_items(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    status: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+    status_filter: Optional[str] = Query(None, alias="status"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Get current user’s items"""
-    query = db.query(FoundItem).filter(FoundItem.user_id == current_user.id)
-    if status:
-        if status == "available":
-            status = ItemStatus.ACTIVE.value
-        query = query.filter(FoundItem.status == status)
-    total = query.count()
-    items = query.offset((page - 1) * limit).limit(limit).all()
-    pages = (total + limit - 1) // limit
-    return PaginatedFoundItems(
-        items=items, total=total, page=page, per_page=limit, pages=pages
-    )
+    stmt = select_rows(FoundItem, FoundItemResponse).where(FoundItem.user_id == current_user.id)
+    if status_filter:
+        status_filter = STATUS_ALIASES.get(status_filter, status_filter)
+        stmt = stmt.where(FoundItem.status == status_filter)
+    return PaginatedFoundItems(**paginate(
+        db, stmt, FoundItem, limit, page=page, cursor=cursor, include_total=include_total
+    ))
 
 
 @router.patch("/{item_id}/status", response_model=FoundItemResponse)
-async def update_found_item_status(
+def update_found_item_status(
     item_id: int,
     new_status: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Update status (owner or admin)"""
-    item = db.query(FoundItem).get(item_id)
-    if not item:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    if item.user_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-
     # Handle legacy “available”
-    if new_status == "available":
-        new_status = ItemStatus.ACTIVE.value
+    new_status = STATUS_ALIASES.get(new_status, new_status)
 
-    if new_status not in {e.value for e in ItemStatus}:
+    if new_status not in VALID_ITEM_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid status: {new_status}"
         )
 
-    item.status = new_status
-    item.updated_at = datetime.utcnow()
+    item = db.execute(
+        update(FoundItem)
+        .where(FoundItem.id == item_id, owned_by(FoundItem, current_user))
+        .values(status=new_status)
+        .returning(FoundItem)
+    ).scalar_one_or_none()
+    if item is None:
+        check_owned_item(db, item_id, current_user)
     db.commit()
-    db.refresh(item)
     return item
 
 
 @router.get("/active/", response_model=PaginatedFoundItems)
-async def get_active_found_items(
-    page: int = Query(1, ge=1),
+# Legacy “available” path: served by the same handler, no extra call
+@router.get("/available/", response_model=PaginatedFoundItems)
+def get_active_found_items(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
     category: Optional[str] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
     """Get all active items"""
-    query = db.query(FoundItem).filter(FoundItem.status == ItemStatus.ACTIVE.value)
+    stmt = select_rows(FoundItem, FoundItemResponse).where(FoundItem.status == ACTIVE_VALUE)
     if category:
-        query = query.filter(FoundItem.category == category)
-    total = query.count()
-    items = query.offset((page - 1) * limit).limit(limit).all()
-    pages = (total + limit - 1) // limit
-    return PaginatedFoundItems(
-        items=items, total=total, page=page, per_page=limit, pages=pages
-    )
+        stmt = stmt.where(FoundItem.category == category)
+    return PaginatedFoundItems(**paginate(
+        db, stmt, FoundItem, limit, page=page, cursor=cursor, include_total=include_total
+    ))
 
-
-@router.get("/available/", response_model=PaginatedFoundItems)
-async def get_available_found_items_legacy(
-    page: int = Query(1, ge=1),
-    limit: int = Query(20, ge=1, le=100),
-    category: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
-):
-    """Legacy endpoint for “available”—redirects to /active/"""
-    return await get_active_found_items(page, limit, category, current_user, db)
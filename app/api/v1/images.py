@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, UploadFile, File, Form, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
+from sqlalchemy import select
 from typing import List, Optional
 import os
+import shutil
 import uuid
-import json
 from datetime import datetime
 from PIL import Image as PILImage
-import numpy as np
 
 # ✅ CORRECT imports:
 from app.models.image_model import Image
@@ -19,7 +21,9 @@ from app.schemas.image_schema import (
 )
 from app.schemas.base_schema import MessageResponse
 from app.database import get_db
-from app.api.deps import get_current_active_user
+from app.core.config import settings
+from app.api.deps import get_current_active_user, is_admin
+from app.api.pagination import paginate, select_rows
 
 router = APIRouter()
 
@@ -27,26 +31,33 @@ router = APIRouter()
 
 
 # Configuration
-UPLOAD_DIRECTORY = "uploaded_images"
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
-
-# Ensure upload directory exists
-os.makedirs(UPLOAD_DIRECTORY, exist_ok=True)
+UPLOAD_DIRECTORY = settings.upload_directory
+MAX_FILE_SIZE = settings.max_file_size
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64KB
+ALLOWED_EXTENSIONS = settings.allowed_extensions
+# Shown in the invalid-type error, built once
+ALLOWED_EXTENSIONS_TEXT = ", ".join(sorted(ALLOWED_EXTENSIONS))
+ITEM_MODELS = {"lost": LostItem, "found": FoundItem}
 
 # Initialize AI service (uncomment when you have it)
 # ai_service = AIMatchingService()
 
 
+def file_extension_of(filename: str) -> str:
+    """Lowercased extension including the dot, or "" if there is none"""
+    _, dot, ext = filename.rpartition(".")
+    return f".{ext.lower()}" if dot else ""
+
+
 def validate_image_file(file: UploadFile) -> None:
     """Validate uploaded image file"""
 
     # Check file extension
-    file_extension = os.path.splitext(file.filename)[1].lower()
+    file_extension = file_extension_of(file.filename)
     if file_extension not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed: {ALLOWED_EXTENSIONS}"
+            detail=f"Invalid file type. Allowed: {ALLOWED_EXTENSIONS_TEXT}"
         )
 
     # Check file size
@@ -68,22 +79,54 @@ def validate_image_file(file: UploadFile) -> None:
         )
 
 
+def get_item_owner_id(db: Session, item_type: str, item_id: int) -> int:
+    """Return the owner of a lost/found item, raising 404 if it doesn't exist"""
+
+    # Only user_id is needed, so don't hydrate the whole item row
+    model = ITEM_MODELS[item_type]
+    owner_id = db.scalar(select(model.user_id).where(model.id == item_id))
+
+    if owner_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{item_type.title()} item not found"
+        )
+
+    return owner_id
+
+
 def save_image_file(file: UploadFile) -> tuple[str, str]:
     """Save uploaded image file and return filename and path"""
 
     # Generate unique filename
-    file_extension = os.path.splitext(file.filename)[1].lower()
+    file_extension = file_extension_of(file.filename)
     unique_filename = f"{uuid.uuid4()}{file_extension}"
     file_path = os.path.join(UPLOAD_DIRECTORY, unique_filename)
 
-    # Save file
-    with open(file_path, "wb") as buffer:
-        content = file.file.read()
-        buffer.write(content)
+    # Stream to disk in chunks rather than reading the whole upload into memory;
+    # a partly written file is removed if the copy fails
+    try:
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer, UPLOAD_CHUNK_SIZE)
+    except Exception:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
 
     return unique_filename, file_path
 
 
+def store_image_file(file: UploadFile) -> tuple[str, str]:
+    """Validate an uploaded image and save it to disk.
+
+    Metadata checks run first, then PIL verifies the spooled upload, which
+    is rewound once and streamed straight to its final path. Callers run
+    the whole thing in one threadpool hop.
+    """
+    validate_image_file(file)
+    return save_image_file(file)
+
+
 @router.post("/upload", response_model=ImageResponse, status_code=status.HTTP_201_CREATED)
 async def upload_image(
     file: UploadFile = File(...),
@@ -95,40 +138,34 @@ async def upload_image(
     """Upload image for item (with item association)"""
 
     # Validate inputs
-    if item_type not in ["lost", "found"]:
+    if item_type not in ITEM_MODELS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="item_type must be 'lost' or 'found'"
         )
 
-    # Check if item exists and user owns it
-    if item_type == "lost":
-        item = db.query(LostItem).filter(LostItem.id == item_id).first()
-    else:
-        item = db.query(FoundItem).filter(FoundItem.id == item_id).first()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{item_type.title()} item not found"
-        )
-
-    if item.user_id != current_user.id and current_user.role != "admin":
+    # Check ownership before the upload is decoded or written anywhere
+    owner_id = await run_in_threadpool(get_item_owner_id, db, item_type, item_id)
+    if owner_id != current_user.id and not is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to upload image for this item"
         )
 
-    # Validate file
-    validate_image_file(file)
-
-    # Save file
-    filename, file_path = save_image_file(file)
+    # Validate and save (PIL + disk I/O) off the event loop
+    filename, file_path = await run_in_threadpool(store_image_file, file)
 
     # Generate CLIP embedding (uncomment when AI service is ready)
     clip_embedding = None
     # try:
+    #     import json
+    #     import numpy as np
+    #
+    #     # Store unit-length vectors so cosine similarity is a dot product
     #     embedding = ai_service.encode_image(file_path)
+    #     norm = np.linalg.norm(embedding)
+    #     if norm:
+    #         embedding = embedding / norm
     #     clip_embedding = json.dumps(embedding.tolist())
     # except Exception as e:
     #     print(f"Failed to generate embedding: {e}")
@@ -147,21 +184,20 @@ async def upload_image(
     )
 
     db.add(new_image)
-    db.commit()
-    db.refresh(new_image)
+    await run_in_threadpool(db.commit)
 
     return new_image
 
 
 @router.get("/{image_id}")
-async def get_image(
+def get_image(
     image_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get specific image file"""
 
-    image = db.query(Image).filter(Image.id == image_id).first()
+    image = db.get(Image, image_id)
 
     if not image:
         raise HTTPException(
@@ -169,19 +205,22 @@ async def get_image(
             detail="Image not found"
         )
 
-    # Check if file exists
-    if not os.path.exists(image.file_path):
+    # Check if file exists; the stat is reused for the response headers
+    try:
+        stat_result = os.stat(image.file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Image file not found on server"
         )
 
-    # Return file response
-    from fastapi.responses import FileResponse
+    # Return file response (handles Range requests and uses the server's
+    # zero-copy pathsend extension when available)
     return FileResponse(
         path=image.file_path,
         media_type=image.content_type,
-        filename=image.original_filename
+        filename=image.original_filename,
+        stat_result=stat_result
     )
 
 
@@ -195,49 +234,60 @@ async def search_similar_images(
 ):
     """Search for similar images using AI/ML"""
 
-    # Validate file
-    validate_image_file(file)
-
-    # Save temporary file
-    temp_filename, temp_path = save_image_file(file)
+    # Validate and save temporary file
+    temp_filename, temp_path = await run_in_threadpool(store_image_file, file)
 
     try:
         # Generate embedding for search image (uncomment when AI service is ready)
         # search_embedding = ai_service.encode_image(temp_path)
 
-        # Get all image embeddings from database
-        images_with_embeddings = db.query(Image).filter(
-            Image.clip_embedding.isnot(None)
-        ).all()
-
         similar_images = []
 
-        # For now, return empty results (uncomment when AI service is ready)
-        # embeddings_db = []
-        # for img in images_with_embeddings:
-        #     try:
-        #         embedding = np.array(json.loads(img.clip_embedding))
-        #         embeddings_db.append((img.id, embedding))
-        #     except Exception:
-        #         continue
-        # 
-        # # Find similar images
-        # similarities = ai_service.find_similar_images(
-        #     temp_path, embeddings_db, top_k=limit
-        # )
-        # 
-        # # Filter by threshold and prepare results
-        # for img_id, similarity in similarities:
-        #     if similarity >= threshold:
-        #         img = db.query(Image).filter(Image.id == img_id).first()
-        #         if img:
-        #             similar_images.append(ImageSearchResult(
-        #                 image_id=img.id,
-        #                 item_id=img.item_id,
-        #                 item_type=img.item_type,
-        #                 similarity_score=similarity,
-        #                 image_url=f"/images/{img.id}"
-        #             ))
+        # For now, return empty results (uncomment when AI service is ready).
+        # Loading every stored embedding is an O(n) scan per request; only
+        # run it once there is a search embedding to compare against.
+        # Only the columns the results need, as plain rows in one query
+        # images_with_embeddings = db.execute(
+        #     select(Image.id, Image.item_id, Image.item_type, Image.clip_embedding)
+        #     .where(Image.clip_embedding.isnot(None))
+        # ).all()
+        #
+        # if images_with_embeddings:
+        #     import json
+        #     import numpy as np
+        #
+        #     # Stored vectors are unit length, so one matrix-vector product
+        #     # scores every candidate by cosine similarity
+        #     candidates = np.array(
+        #         [json.loads(img.clip_embedding) for img in images_with_embeddings],
+        #         dtype=np.float32,
+        #     )
+        #     # A zero query scores 0 everywhere instead of NaN
+        #     query = search_embedding
+        #     norm = np.linalg.norm(query)
+        #     if norm:
+        #         query = query / norm
+        #     scores = candidates @ query
+        #
+        #     # Pick the best `limit` in O(n) without sorting the tail, then
+        #     # threshold and order just those
+        #     if len(scores) > limit:
+        #         top = np.argpartition(-scores, limit)[:limit]
+        #     else:
+        #         top = np.arange(len(scores))
+        #     top = top[scores[top] >= threshold]
+        #     top = top[np.argsort(-scores[top])]
+        #
+        #     for i in top:
+        #         similarity = float(scores[i])
+        #         img = images_with_embeddings[i]
+        #         similar_images.append(ImageSearchResult(
+        #             image_id=img.id,
+        #             item_id=img.item_id,
+        #             item_type=img.item_type,
+        #             similarity_score=similarity,
+        #             image_url=f"/images/{img.id}"
+        #         ))
 
         search_time_ms = 50.0  # Placeholder
 
@@ -254,14 +304,14 @@ async def search_similar_images(
 
 
 @router.delete("/{image_id}", response_model=MessageResponse)
-async def delete_image(
+def delete_image(
     image_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Delete image (owner/admin only)"""
 
-    image = db.query(Image).filter(Image.id == image_id).first()
+    image = db.get(Image, image_id)
 
     if not image:
         raise HTTPException(
@@ -270,7 +320,7 @@ async def delete_image(
         )
 
     # Check ownership or admin
-    if image.uploaded_by != current_user.id and current_user.role != "admin":
+    if image.uploaded_by != current_user.id and not is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this image"
@@ -288,7 +338,7 @@ async def delete_image(
 
 
 @router.get("/item/{item_id}/{item_type}", response_model=List[ImageResponse])
-async def get_item_images(
+def get_item_images(
     item_id: int,
     item_type: str,
     current_user: User = Depends(get_current_active_user),
@@ -296,23 +346,14 @@ async def get_item_images(
 ):
     """Get all images for a specific item"""
 
-    if item_type not in ["lost", "found"]:
+    if item_type not in ITEM_MODELS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="item_type must be 'lost' or 'found'"
         )
 
     # Check if item exists
-    if item_type == "lost":
-        item = db.query(LostItem).filter(LostItem.id == item_id).first()
-    else:
-        item = db.query(FoundItem).filter(FoundItem.id == item_id).first()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{item_type.title()} item not found"
-        )
+    get_item_owner_id(db, item_type, item_id)
 
     # Get images
     images = db.query(Image).filter(
@@ -324,29 +365,38 @@ async def get_item_images(
 
 
 @router.get("/", response_model=List[ImageResponse])
-async def get_all_images(
-    page: int = Query(1, ge=1),
+def get_all_images(
+    response: Response,
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
     item_type: Optional[str] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
-    """Get all images with pagination (for admin/debugging)"""
+    """Get all images with pagination (for admin/debugging)
+
+    The body stays a plain list; the cursor for the next page is sent in
+    the X-Next-Cursor header and, when requested, the total in X-Total-Count.
+    """
 
     # Admin only for now
-    if current_user.role != "admin":
+    if not is_admin(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
 
-    query = db.query(Image)
+    stmt = select_rows(Image, ImageResponse)
 
     if item_type:
-        query = query.filter(Image.item_type == item_type)
+        stmt = stmt.where(Image.item_type == item_type)
 
-    # Apply pagination
-    offset = (page - 1) * limit
-    images = query.offset(offset).limit(limit).all()
+    result = paginate(db, stmt, Image, limit, page=page, cursor=cursor, include_total=include_total)
+    if result["next_cursor"]:
+        response.headers["X-Next-Cursor"] = result["next_cursor"]
+    if result["total"] is not None:
+        response.headers["X-Total-Count"] = str(result["total"])
 
-    return images
+    return result["items"]
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update, delete
 from typing import List, Optional
 from datetime import datetime
 
@@ -9,7 +9,7 @@ from datetime import datetime
 # from schemas import (...)
 
 # ✅ CORRECT imports for your project structure:
-from app.models.lost_item import LostItem
+from app.models.lost_item import LostItem, ItemStatus
 from app.models.user import User
 from app.schemas.lost_item import (
     LostItemCreate, LostItemUpdate, LostItemResponse, LostItemPublic,
@@ -17,12 +17,41 @@ from app.schemas.lost_item import (
 )
 from app.schemas.base_schema import MessageResponse
 from app.database import get_db
-from app.api.deps import get_current_active_user, get_admin_user
+from app.api.deps import get_current_active_user, get_admin_user, is_admin, owned_by
+from app.api.pagination import paginate, select_rows
 
 router = APIRouter()
 
+# Accepted by the status endpoint; the error message is built once
+_STATUS_VALUES = [e.value for e in ItemStatus]
+VALID_ITEM_STATUSES: frozenset[str] = frozenset(_STATUS_VALUES)
+INVALID_STATUS_MESSAGE = f"Invalid status. Must be one of: {_STATUS_VALUES}"
+
+
+def check_owned_item(db: Session, item_id: int, user: User, action: str = "update") -> LostItem:
+    """Load a lost item the user may modify, raising 404 or 403 otherwise.
+
+    Writes check ownership in their WHERE clause; this explains a miss.
+    """
+    item = db.get(LostItem, item_id)
+
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Lost item not found"
+        )
+
+    # Check ownership (or admin)
+    if item.user_id != user.id and not is_admin(user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this item"
+        )
+
+    return item
+
 @router.post("/", response_model=LostItemResponse, status_code=status.HTTP_201_CREATED)
-async def create_lost_item(
+def create_lost_item(
     item_data: LostItemCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -42,31 +71,32 @@ async def create_lost_item(
 
     db.add(new_item)
     db.commit()
-    db.refresh(new_item)
 
     return new_item
 
 
 @router.get("/", response_model=PaginatedLostItems)
-async def get_lost_items(
-    page: int = Query(1, ge=1),
+def get_lost_items(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+    search: Optional[str] = Query(None, max_length=100),
     category: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
-    location: Optional[str] = Query(None),
-    date_from: Optional[str] = Query(None),
-    date_to: Optional[str] = Query(None),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    location: Optional[str] = Query(None, max_length=200),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """List all lost items with search and filtering"""
 
-    query = db.query(LostItem)
+    stmt = select_rows(LostItem, LostItemResponse)
 
     # Apply filters
     if search:
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 LostItem.title.ilike(f"%{search}%"),
                 LostItem.description.ilike(f"%{search}%")
@@ -74,62 +104,35 @@ async def get_lost_items(
         )
 
     if category:
-        query = query.filter(LostItem.category == category)
+        stmt = stmt.where(LostItem.category == category)
 
-    if status:
-        query = query.filter(LostItem.status == status)
+    if status_filter:
+        stmt = stmt.where(LostItem.status == status_filter)
 
     if location:
-        query = query.filter(LostItem.location_lost.ilike(f"%{location}%"))
+        stmt = stmt.where(LostItem.location_lost.ilike(f"%{location}%"))
 
+    # date_from/date_to are parsed (and rejected with 422) by FastAPI
     if date_from:
-        try:
-            from_date = datetime.fromisoformat(date_from)
-            query = query.filter(LostItem.date_lost >= from_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid date_from format. Use ISO format."
-            )
+        stmt = stmt.where(LostItem.date_lost >= date_from)
 
     if date_to:
-        try:
-            to_date = datetime.fromisoformat(date_to)
-            query = query.filter(LostItem.date_lost <= to_date)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid date_to format. Use ISO format."
-            )
+        stmt = stmt.where(LostItem.date_lost <= date_to)
 
-    # Get total count
-    total = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * limit
-    items = query.offset(offset).limit(limit).all()
-
-    # Calculate pagination info
-    pages = (total + limit - 1) // limit
-
-    return PaginatedLostItems(
-        items=items,
-        total=total,
-        page=page,
-        per_page=limit,
-        pages=pages
-    )
+    return PaginatedLostItems(**paginate(
+        db, stmt, LostItem, limit, page=page, cursor=cursor, include_total=include_total
+    ))
 
 
 @router.get("/{item_id}", response_model=LostItemResponse)
-async def get_lost_item(
+def get_lost_item(
     item_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get specific lost item details"""
 
-    item = db.query(LostItem).filter(LostItem.id == item_id).first()
+    item = db.get(LostItem, item_id)
 
     if not item:
         raise HTTPException(
@@ -141,7 +144,7 @@ async def get_lost_item(
 
 
 @router.put("/{item_id}", response_model=LostItemResponse)
-async def update_lost_item(
+def update_lost_item(
     item_id: int,
     item_update: LostItemUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -149,98 +152,74 @@ async def update_lost_item(
 ):
     """Update lost item details (owner only)"""
 
-    item = db.query(LostItem).filter(LostItem.id == item_id).first()
+    update_data = item_update.model_dump(exclude_unset=True)
 
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lost item not found"
-        )
-
-    # Check ownership (or admin)
-    if item.user_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this item"
-        )
+    # Update and ownership check (or admin) in one UPDATE ... RETURNING
+    item = None
+    if update_data:
+        item = db.execute(
+            update(LostItem)
+            .where(LostItem.id == item_id, owned_by(LostItem, current_user))
+            .values(**update_data)
+            .returning(LostItem)
+        ).scalar_one_or_none()
 
-    # Update fields if provided
-    update_data = item_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(item, field, value)
+    # No row came back (or nothing to update): find out why
+    if item is None:
+        item = check_owned_item(db, item_id, current_user)
 
-    item.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(item)
 
     return item
 
 
 @router.delete("/{item_id}", response_model=MessageResponse)
-async def delete_lost_item(
+def delete_lost_item(
     item_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Delete lost item entry (owner only)"""
 
-    item = db.query(LostItem).filter(LostItem.id == item_id).first()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lost item not found"
-        )
+    # Delete and ownership check (or admin) in one statement
+    deleted_id = db.execute(
+        delete(LostItem)
+        .where(LostItem.id == item_id, owned_by(LostItem, current_user))
+        .returning(LostItem.id)
+    ).scalar_one_or_none()
 
-    # Check ownership (or admin)
-    if item.user_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this item"
-        )
+    if deleted_id is None:
+        check_owned_item(db, item_id, current_user, action="delete")
 
-    db.delete(item)
     db.commit()
 
     return MessageResponse(message="Lost item deleted successfully", success=True)
 
 
 @router.get("/my-items/", response_model=PaginatedLostItems)
-async def get_my_lost_items(
-    page: int = Query(1, ge=1),
+def get_my_lost_items(
+    page: Optional[int] = Query(None, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    status: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(False),
+    status_filter: Optional[str] = Query(None, alias="status"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Get current user's lost items"""
 
-    query = db.query(LostItem).filter(LostItem.user_id == current_user.id)
-
-    if status:
-        query = query.filter(LostItem.status == status)
+    stmt = select_rows(LostItem, LostItemResponse).where(LostItem.user_id == current_user.id)
 
-    # Get total count
-    total = query.count()
+    if status_filter:
+        stmt = stmt.where(LostItem.status == status_filter)
 
-    # Apply pagination
-    offset = (page - 1) * limit
-    items = query.offset(offset).limit(limit).all()
-
-    # Calculate pagination info
-    pages = (total + limit - 1) // limit
-
-    return PaginatedLostItems(
-        items=items,
-        total=total,
-        page=page,
-        per_page=limit,
-        pages=pages
-    )
+    return PaginatedLostItems(**paginate(
+        db, stmt, LostItem, limit, page=page, cursor=cursor, include_total=include_total
+    ))
 
 
 @router.patch("/{item_id}/status", response_model=LostItemResponse)
-async def update_lost_item_status(
+def update_lost_item_status(
     item_id: int,
     new_status: str,
     current_user: User = Depends(get_current_active_user),
@@ -248,38 +227,30 @@ async def update_lost_item_status(
 ):
     """Update lost item status (owner only)"""
 
-    item = db.query(LostItem).filter(LostItem.id == item_id).first()
-
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lost item not found"
-        )
-
-    # Check ownership (or admin)
-    if item.user_id != current_user.id and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this item"
-        )
-
     # Validate status
-    valid_statuses = ["active", "claimed", "resolved", "expired"]
-    if new_status not in valid_statuses:
+    if new_status not in VALID_ITEM_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid status. Must be one of: {valid_statuses}"
+            detail=INVALID_STATUS_MESSAGE
         )
 
-    item.status = new_status
-    item.updated_at = datetime.utcnow()
+    # Update and ownership check (or admin) in one UPDATE ... RETURNING
+    item = db.execute(
+        update(LostItem)
+        .where(LostItem.id == item_id, owned_by(LostItem, current_user))
+        .values(status=new_status)
+        .returning(LostItem)
+    ).scalar_one_or_none()
+
+    if item is None:
+        check_owned_item(db, item_id, current_user)
+
     db.commit()
-    db.refresh(item)
 
     return item
 
 @router.get("/admin/lost-items-by-student/", response_model=List[LostItemResponse], tags=["Admin"])
-async def get_lost_items_by_student(
+def get_lost_items_by_student(
     student_id: int = Query(..., description="ID of the student/user"),
     current_user: User = Depends(get_admin_user),  # Only admins allowed
     db: Session = Depends(get_db),
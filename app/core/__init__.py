@@ -2,7 +2,7 @@
 Core configuration and utilities for TrackMate
 """
 
-from .config import settings
+from .config import settings, get_settings
 from .security import (
     verify_password,
     get_password_hash,
@@ -12,6 +12,7 @@ from .security import (
 
 __all__ = [
     "settings",
+    "get_settings",
     "verify_password",
     "get_password_hash", 
     "create_access_token",
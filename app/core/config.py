@@ -2,9 +2,9 @@
 Core configuration settings for TrackMate
 """
 
-from pydantic_settings import BaseSettings
-from typing import Optional, List
-import os
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property, lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -46,26 +46,31 @@ class Settings(BaseSettings):
     allowed_origins_str: str = "*"
     
     # Convert string fields to lists
-    @property
-    def allowed_extensions(self) -> List[str]:
-        """Convert comma-separated string to list"""
-        return [ext.strip() for ext in self.allowed_extensions_str.split(',')]
+    @cached_property
+    def allowed_extensions(self) -> frozenset[str]:
+        """Convert comma-separated string to a set (parsed once)"""
+        return frozenset(ext.strip().lower() for ext in self.allowed_extensions_str.split(','))
     
-    @property 
-    def allowed_origins(self) -> List[str]:
-        """Convert comma-separated string to list"""
+    @cached_property
+    def allowed_origins(self) -> tuple[str, ...]:
+        """Convert comma-separated string to a tuple (parsed once)"""
         if self.allowed_origins_str == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.allowed_origins_str.split(',')]
+            return ("*",)
+        return tuple(origin.strip() for origin in self.allowed_origins_str.split(','))
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"  # Ignore extra fields
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",  # Ignore extra fields
+        frozen=True,  # Read-only after load; parsed values are cached below
+    )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment/.env once per process"""
+    return Settings()
+
 
-# Ensure upload directory exists
-os.makedirs(settings.upload_directory, exist_ok=True)
+# Global settings instance
+settings = get_settings()
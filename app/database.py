@@ -2,45 +2,89 @@
 Database configuration and setup for TrackMate
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, Session
 from typing import Generator
+import logging
 import os
 
-# Import your models to ensure they're registered
-from app.models import *
+logger = logging.getLogger(__name__)
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./trackmate.db")
 
+# Size of the engine's compiled-statement LRU (SQLAlchemy default is 500)
+QUERY_CACHE_SIZE = 1200
+
+# Connection pool for PostgreSQL (SQLite keeps SQLAlchemy's default)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Replace connections older than this (seconds) before idle timeouts drop them
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 # Create engine
 if DATABASE_URL.startswith("sqlite"):
     engine = create_engine(
         DATABASE_URL,
         connect_args={"check_same_thread": False},  # Only for SQLite
+        query_cache_size=QUERY_CACHE_SIZE,
         echo=False  # Set to True for SQL debugging
     )
 else:
     # PostgreSQL configuration
     engine = create_engine(
         DATABASE_URL,
+        query_cache_size=QUERY_CACHE_SIZE,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,  # Drop connections the server has closed
         echo=False
     )
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps loaded attributes readable after commit, so
+# returning a committed object doesn't trigger another SELECT
+SessionLocal = sessionmaker(
+    autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def create_tables():
     """Create all tables in the database"""
+    # Register the model tables on SQLModel.metadata; deferred to here so
+    # importing the engine alone doesn't pull in every model
+    import app.models  # noqa: F401
+
+    create_extensions()
     SQLModel.metadata.create_all(bind=engine)
-    print("✅ Database tables created successfully!")
+    create_indexes()
+    logger.info("✅ Database tables created successfully!")
+
+
+def create_extensions():
+    """Enable the Postgres extensions the model indexes rely on"""
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+def create_indexes():
+    """Create indexes added to models after their tables already existed"""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def get_db() -> Generator[Session, None, None]:
     """
     Database dependency for FastAPI endpoints
+
+    Sessions are synchronous, so endpoints that use one are declared with
+    plain ``def`` and run in FastAPI's threadpool rather than on the event loop.
     """
     db = SessionLocal()
     try:
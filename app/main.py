@@ -1,12 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
+import logging
+import os
 
 # Import settings first to check configuration
 from app.core.config import settings
 
+# Handlers are configured by whoever runs the app (the __main__ block below,
+# or uvicorn's --log-config), never on import
+logger = logging.getLogger(__name__)
+
 # Import the combined router
-from app.api.v1 import auth, lost_items, found_items, claims, images
+from app.api.v1 import api_router
 
 app = FastAPI(
     title=settings.app_name,
@@ -24,40 +29,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers with correct prefixes
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
-app.include_router(lost_items.router, prefix="/api/v1/lost-items", tags=["Lost Items"])
-app.include_router(found_items.router, prefix="/api/v1/found-items", tags=["Found Items"])
-app.include_router(claims.router, prefix="/api/v1/claims", tags=["Claims"])
-app.include_router(images.router, prefix="/api/v1/images", tags=["Images"])
+# Include the v1 router (per-resource prefixes and tags live in app.api.v1)
+app.include_router(api_router, prefix="/api/v1")
+
+# Settings are frozen, so these bodies never change; build them once
+_ROOT_RESPONSE = {
+    "message": "🚀 TrackMate API is running!",
+    "version": settings.app_version,
+    "docs": "/docs",
+    "environment": settings.environment
+}
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "environment": settings.environment,
+    "debug": settings.debug
+}
 
 @app.get("/")
 async def root():
-    return {
-        "message": "🚀 TrackMate API is running!",
-        "version": settings.app_version,
-        "docs": "/docs",
-        "environment": settings.environment
-    }
+    return _ROOT_RESPONSE
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "environment": settings.environment,
-        "debug": settings.debug
-    }
+    return _HEALTH_RESPONSE
 
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
     from app.database import init_db
     init_db()
-    print("🚀 TrackMate API started successfully!")
-    print(f"📚 API Documentation: http://localhost:8000/docs")
-    print(f"🔧 Environment: {settings.environment}")
+    # Created here rather than at import, so tools that only load settings
+    # don't touch the filesystem
+    os.makedirs(settings.upload_directory, exist_ok=True)
+    logger.info("🚀 TrackMate API started successfully!")
+    logger.info("📚 API Documentation: http://localhost:8000/docs")
+    logger.info("🔧 Environment: %s", settings.environment)
 
 if __name__ == "__main__":
+    # Only needed when run directly; a server importing app.main has it already
+    import uvicorn
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
     uvicorn.run(
         "app.main:app", 
         host="127.0.0.1", 
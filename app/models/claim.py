@@ -1,8 +1,25 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
 from datetime import datetime, timezone
 
 class Claim(SQLModel, table=True):
+    # Match the filter + newest-first ordering of the claim list endpoints
+    __table_args__ = (
+        Index("ix_claim_status_created", "status", "created_at", "id"),
+        Index("ix_claim_user_created", "user_id", "created_at", "id"),
+        # Duplicate-claim check in create_claim: found_item_id + user_id
+        Index("ix_claim_found_item_user", "found_item_id", "user_id"),
+        # Partial index: stays small however many claims have been decided
+        Index(
+            "ix_claim_pending_created",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", nullable=False)
     found_item_id: int = Field(foreign_key="found_items.id", nullable=False)
@@ -14,4 +31,7 @@ class Claim(SQLModel, table=True):
     verification_notes: Optional[str] = None
     rejection_reason: Optional[str] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)},
+    )
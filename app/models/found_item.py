@@ -1,8 +1,11 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime, timezone
 from enum import Enum
 
+from app.models.indexes import trigram_index
+
 # Add the same enums here too
 class ItemCategory(str, Enum):
     ELECTRONICS = "electronics"
@@ -25,6 +28,16 @@ class ItemStatus(str, Enum):
 # Your FoundItem model
 class FoundItem(SQLModel, table=True):
     __tablename__ = "found_items"
+    # Match the filter + newest-first ordering of the list endpoints
+    __table_args__ = (
+        Index("ix_found_item_status_category_created", "status", "category", "created_at", "id"),
+        Index("ix_found_item_user_created", "user_id", "created_at", "id"),
+        # Trigram indexes for the %search% / %location% ILIKE filters
+        trigram_index("ix_found_item_title_trgm", "title"),
+        trigram_index("ix_found_item_description_trgm", "description"),
+        trigram_index("ix_found_item_location_found_trgm", "location_found"),
+        trigram_index("ix_found_item_current_location_trgm", "current_location"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(nullable=False, max_length=100)
@@ -46,4 +59,7 @@ class FoundItem(SQLModel, table=True):
     
     # Audit fields
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)},
+    )
@@ -1,10 +1,16 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime, timezone
 
 
 class Image(SQLModel, table=True):
     __tablename__ = "images"
+    # Per-item image lookups and the admin list (item_type filter, newest first)
+    __table_args__ = (
+        Index("ix_image_item", "item_id", "item_type"),
+        Index("ix_image_item_type_created", "item_type", "created_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     filename: str = Field(nullable=False)
@@ -25,4 +31,7 @@ class Image(SQLModel, table=True):
 
     # Audit fields
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)},
+    )
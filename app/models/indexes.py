@@ -0,0 +1,18 @@
+"""
+Shared index definitions for TrackMate models
+"""
+
+from sqlalchemy import Index
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index so Postgres can serve %term% ILIKE filters on a column.
+
+    Needs the pg_trgm extension and is skipped on other databases.
+    """
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 
 class MatchLog(SQLModel,table = True):
     id: Optional[int] = Field(default = None,primary_key=True)
-    lost_item_id : int = Field(foreign_key="lost_items.id")
-    found_item_id : int = Field(foreign_key="found_items.id")
+    lost_item_id : int = Field(foreign_key="lost_items.id", index=True)
+    found_item_id : int = Field(foreign_key="found_items.id", index=True)
     similarity_score : float
-    matched_on : datetime = Field(default_factory=lambda:datetime.now(timezone.utc))
+    matched_on : datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -1,9 +1,12 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
 from datetime import datetime, timezone
 
 class StudentRegistry(SQLModel, table = True):
     __tablename__ = "student_registry"
+    # Signup matches registry emails case-insensitively on lower(email)
+    __table_args__ = (Index("ix_student_registry_email_lower", text("lower(email)")),)
 
     id: Optional[int] = Field(default = None, primary_key = True)
     student_id: str = Field(index = True,nullable = False)
@@ -17,4 +20,7 @@ class StudentRegistry(SQLModel, table = True):
 
     
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)},
+    )
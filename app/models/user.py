@@ -1,15 +1,18 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
 from datetime import datetime, timezone
 from enum import Enum
 
 class UserRole(str, Enum):
     STUDENT = "student"
-    ADMIN = "ADMIN"
+    ADMIN = "admin"
     STAFF = "staff"
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    # Login and signup match emails case-insensitively on lower(email)
+    __table_args__ = (Index("ix_users_email_lower", text("lower(email)")),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(nullable=False, unique=True, max_length=100)
@@ -25,5 +28,8 @@ class User(SQLModel, table=True):
     
     # Timestamps
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)},
+    )
     last_login: Optional[datetime] = Field(default=None)
@@ -2,60 +2,64 @@
 Pydantic schemas for API request/response validation
 """
 
-# User schemas
-from .user import (
-    UserSignup,
-    UserLogin,
-    UserUpdate,
-    UserResponse,
-    TokenResponse,
-    RefreshTokenRequest
-)
+import importlib
+
+# Re-exported names and the submodule that defines each. They are imported
+# on first access (PEP 562), so importing one schema module doesn't build
+# the pydantic validators of every other one.
+_LAZY = {
+    # User schemas
+    "UserSignup": ".user",
+    "UserLogin": ".user",
+    "UserUpdate": ".user",
+    "UserResponse": ".user",
+    "TokenResponse": ".user",
+    "RefreshTokenRequest": ".user",
+    # Lost item schemas
+    "LostItemCreate": ".lost_item",
+    "LostItemUpdate": ".lost_item",
+    "LostItemResponse": ".lost_item",
+    "LostItemPublic": ".lost_item",
+    "PaginatedLostItems": ".lost_item",
+    # Found item schemas
+    "FoundItemCreate": ".found_item",
+    "FoundItemUpdate": ".found_item",
+    "FoundItemResponse": ".found_item",
+    "FoundItemPublic": ".found_item",
+    "PaginatedFoundItems": ".found_item",
+    # Claim schemas
+    "ClaimCreate": ".claim",
+    "ClaimUpdate": ".claim",
+    "ClaimResponse": ".claim",
+    "ClaimApproval": ".claim",
+    "ClaimRejection": ".claim",
+    "PaginatedClaims": ".claim",
+    # Image schemas
+    "ImageUpload": ".image_schema",
+    "ImageResponse": ".image_schema",
+    "ImageSearchRequest": ".image_schema",
+    "ImageSearchResult": ".image_schema",
+    "SimilarImagesResponse": ".image_schema",
+    # Base schemas
+    "MessageResponse": ".base_schema",
+    "ErrorResponse": ".base_schema",
+    "PaginationParams": ".base_schema",
+    "SearchParams": ".base_schema",
+}
 
-# Lost item schemas
-from .lost_item import (
-    LostItemCreate,
-    LostItemUpdate,
-    LostItemResponse,
-    LostItemPublic,
-    PaginatedLostItems
-)
 
-# Found item schemas
-from .found_item import (
-    FoundItemCreate,
-    FoundItemUpdate,
-    FoundItemResponse,
-    FoundItemPublic,
-    PaginatedFoundItems
-)
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
 
-# Claim schemas
-from .claim import (
-    ClaimCreate,
-    ClaimUpdate,
-    ClaimResponse,
-    ClaimApproval,
-    ClaimRejection,
-    PaginatedClaims
-)
 
-# Image schemas
-from .image_schema import (
-    ImageUpload,
-    ImageResponse,
-    ImageSearchRequest,
-    ImageSearchResult,
-    SimilarImagesResponse
-)
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
 
-# Base schemas
-from .base_schema import (
-    MessageResponse,
-    ErrorResponse,
-    PaginationParams,
-    SearchParams
-)
 
 __all__ = [
     # User schemas
@@ -1,19 +1,19 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional
 from datetime import datetime
 
 class ClaimCreate(BaseModel):
     """Schema for creating claims"""
     found_item_id: int
-    claim_reason: str
-    contact_info: str
-    additional_proof: Optional[str] = None
+    claim_reason: str = Field(max_length=1000)
+    contact_info: str = Field(max_length=200)
+    additional_proof: Optional[str] = Field(default=None, max_length=1000)
 
 class ClaimUpdate(BaseModel):
     """Schema for updating claims (admin only)"""
-    status: Optional[str] = None
-    verification_notes: Optional[str] = None
-    rejection_reason: Optional[str] = None
+    status: Optional[Literal["pending", "approved", "rejected"]] = None
+    verification_notes: Optional[str] = Field(default=None, max_length=1000)
+    rejection_reason: Optional[str] = Field(default=None, max_length=1000)
 
 class ClaimResponse(BaseModel):
     """Schema for claim response"""
@@ -34,16 +34,17 @@ class ClaimResponse(BaseModel):
 
 class ClaimApproval(BaseModel):
     """Schema for claim approval"""
-    approval_notes: Optional[str] = None
+    approval_notes: Optional[str] = Field(default=None, max_length=1000)
 
 class ClaimRejection(BaseModel):
     """Schema for claim rejection"""
-    rejection_reason: str
+    rejection_reason: str = Field(max_length=1000)
 
 class PaginatedClaims(BaseModel):
     """Schema for paginated claims response"""
     claims: list[ClaimResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
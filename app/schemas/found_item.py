@@ -1,46 +1,28 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
-from enum import Enum
 
-# Add the enums (if not importing from models)
-class ItemCategory(str, Enum):
-    ELECTRONICS = "electronics"
-    CLOTHING = "clothing"
-    ACCESSORIES = "accessories"
-    BOOKS = "books"
-    DOCUMENTS = "documents"
-    SPORTS = "sports"
-    BAGS = "bags"
-    JEWELRY = "jewelry"
-    KEYS = "keys"
-    OTHERS = "others"
-
-class ItemStatus(str, Enum):
-    ACTIVE = "active"
-    CLAIMED = "claimed"
-    RESOLVED = "resolved"
-    EXPIRED = "expired"
+from .categories import ItemCategory, ItemStatus
 
 class FoundItemCreate(BaseModel):
     """Schema for creating found items"""
-    title: str
-    description: str
+    title: str = Field(max_length=100)
+    description: str = Field(max_length=1000)
     category: ItemCategory
-    location_found: str
+    location_found: str = Field(max_length=200)
     date_found: datetime
-    current_location: Optional[str] = None
-    handover_instructions: Optional[str] = None
+    current_location: Optional[str] = Field(default=None, max_length=200)
+    handover_instructions: Optional[str] = Field(default=None, max_length=1000)
 
 class FoundItemUpdate(BaseModel):
     """Schema for updating found items"""
-    title: Optional[str] = None
-    description: Optional[str] = None
+    title: Optional[str] = Field(default=None, max_length=100)
+    description: Optional[str] = Field(default=None, max_length=1000)
     category: Optional[ItemCategory] = None
-    location_found: Optional[str] = None
+    location_found: Optional[str] = Field(default=None, max_length=200)
     date_found: Optional[datetime] = None
-    current_location: Optional[str] = None
-    handover_instructions: Optional[str] = None
+    current_location: Optional[str] = Field(default=None, max_length=200)
+    handover_instructions: Optional[str] = Field(default=None, max_length=1000)
     status: Optional[ItemStatus] = None
 
 class FoundItemResponse(BaseModel):
@@ -77,7 +59,8 @@ class FoundItemPublic(BaseModel):
 class PaginatedFoundItems(BaseModel):
     """Schema for paginated found items response"""
     items: list[FoundItemResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
@@ -1,12 +1,15 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
 
+# Closed set, so validation is a single lookup
+ItemType = Literal["lost", "found"]
+
 
 class ImageUpload(BaseModel):
     """Schema for uploading images via form-data"""
     item_id: int
-    item_type: str  # 'lost' or 'found'
+    item_type: ItemType
 
 
 class ImageResponse(BaseModel):
@@ -35,7 +38,7 @@ class ImageSearchResult(BaseModel):
     """Schema for image search results"""
     image_id: int
     item_id: int
-    item_type: str
+    item_type: ItemType
     similarity_score: float
     image_url: str
 
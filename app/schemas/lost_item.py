@@ -1,46 +1,28 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
-from enum import Enum
 
-# Add the enums
-class ItemCategory(str, Enum):
-    ELECTRONICS = "electronics"
-    CLOTHING = "clothing"
-    ACCESSORIES = "accessories"
-    BOOKS = "books"
-    DOCUMENTS = "documents"
-    SPORTS = "sports"
-    BAGS = "bags"
-    JEWELRY = "jewelry"
-    KEYS = "keys"
-    OTHERS = "others"
-
-class ItemStatus(str, Enum):
-    ACTIVE = "active"
-    CLAIMED = "claimed"
-    RESOLVED = "resolved"
-    EXPIRED = "expired"
+from .categories import ItemCategory, ItemStatus
 
 class LostItemCreate(BaseModel):
     """Schema for creating lost items"""
-    title: str
-    description: str
+    title: str = Field(max_length=100)
+    description: str = Field(max_length=1000)
     category: ItemCategory
-    location_lost: str
+    location_lost: str = Field(max_length=200)
     date_lost: datetime
-    contact_info: Optional[str] = None
-    reward_offered: Optional[str] = None
+    contact_info: Optional[str] = Field(default=None, max_length=200)
+    reward_offered: Optional[str] = Field(default=None, max_length=100)
 
 class LostItemUpdate(BaseModel):
     """Schema for updating lost items"""
-    title: Optional[str] = None
-    description: Optional[str] = None
+    title: Optional[str] = Field(default=None, max_length=100)
+    description: Optional[str] = Field(default=None, max_length=1000)
     category: Optional[ItemCategory] = None
-    location_lost: Optional[str] = None
+    location_lost: Optional[str] = Field(default=None, max_length=200)
     date_lost: Optional[datetime] = None
-    contact_info: Optional[str] = None
-    reward_offered: Optional[str] = None
+    contact_info: Optional[str] = Field(default=None, max_length=200)
+    reward_offered: Optional[str] = Field(default=None, max_length=100)
     status: Optional[ItemStatus] = None
 
 class LostItemResponse(BaseModel):
@@ -77,7 +59,8 @@ class LostItemPublic(BaseModel):
 class PaginatedLostItems(BaseModel):
     """Schema for paginated lost items response"""
     items: list[LostItemResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
@@ -1,11 +1,11 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 class StudentRegistryCreate(BaseModel):
-    student_id: str
+    student_id: str = Field(max_length=50)
     email: EmailStr
-    full_name: str
-    college_name:str
-    department:str
+    full_name: str = Field(max_length=100)
+    college_name: str = Field(max_length=100)
+    department: str = Field(max_length=100)
 
 class StudentRegistryRead(StudentRegistryCreate):
     id: int
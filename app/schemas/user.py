@@ -1,24 +1,57 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, EmailStr, ConfigDict, Field, field_validator
+from typing import Any, Optional
 from datetime import datetime
 
+
+def _normalize_email(value: Any) -> Any:
+    """Lowercase emails; lookups compare against lower(email), so older rows match too"""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+
+# bcrypt only uses the first 72 bytes of a password
+_BCRYPT_MAX_BYTES = 72
+
+
 class UserSignup(BaseModel):
     """Schema for user registration"""
     email: EmailStr
-    password: str
-    student_id: str
-    full_name: str
+    password: str = Field(max_length=_BCRYPT_MAX_BYTES)
+    student_id: str = Field(max_length=50)
+    full_name: str = Field(max_length=100)
+
+    _normalize_email = field_validator("email", mode="before")(_normalize_email)
+
+    @field_validator("student_id", mode="before")
+    @classmethod
+    def _strip_student_id(cls, value: Any) -> Any:
+        # Registry ids are case-sensitive (e.g. "STU001"), so only trim them
+        if isinstance(value, str):
+            return value.strip()
+        return value
+
+    @field_validator("password")
+    @classmethod
+    def _check_password_bytes(cls, value: str) -> str:
+        # max_length counts characters; multi-byte ones can still exceed bcrypt's limit
+        if len(value.encode()) > _BCRYPT_MAX_BYTES:
+            raise ValueError(f"Password must be at most {_BCRYPT_MAX_BYTES} bytes")
+        return value
 
 class UserLogin(BaseModel):
     """Schema for user login"""
     email: EmailStr
-    password: str
+    # Looser than signup so accounts created before the byte limit still log in
+    password: str = Field(max_length=128)
+
+    _normalize_email = field_validator("email", mode="before")(_normalize_email)
 
 class UserUpdate(BaseModel):
     """Schema for updating user profile"""
-    full_name: Optional[str] = None
-    phone: Optional[str] = None
-    bio: Optional[str] = None
+    full_name: Optional[str] = Field(default=None, max_length=100)
+    phone: Optional[str] = Field(default=None, max_length=20)
+    bio: Optional[str] = Field(default=None, max_length=500)
 
 class UserResponse(BaseModel):
     """Schema for user response"""
@@ -3,6 +3,7 @@ Database initialization script for TrackMate
 Run this once to create tables and add test data
 """
 
+import logging
 import sys
 import os
 
@@ -59,10 +60,9 @@ def create_test_data():
             )
         ]
         
-        # Add test students to database
-        for student in test_students:
-            db.add(student)
-        
+        # Add test students to database; flushed as one batched INSERT
+        db.add_all(test_students)
+
         db.commit()
         print("✅ Test student data created successfully!")
         print("📧 Test emails available:")
@@ -78,4 +78,6 @@ def create_test_data():
         db.close()
 
 if __name__ == "__main__":
+    # Show the app's own progress messages alongside this script's
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     create_test_data()